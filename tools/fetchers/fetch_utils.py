@@ -0,0 +1,235 @@
+"""
+Shared Fetcher Utilities
+========================
+Helpers shared by the unified fetchers (V4, V5): pooled HTTP sessions, fast
+JSON encoding and a TTL-based JSON file cache in data/cache.
+"""
+
+import os
+import re
+import json
+import math
+import shutil
+import asyncio
+import hashlib
+import logging
+import pathlib
+import threading
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional fast JSON codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+# Paths
+ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
+CACHE_DIR = ROOT_DIR / 'data' / 'cache'
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def build_session() -> requests.Session:
+    """Session with pooled keep-alive connections and backoff on transient errors"""
+    session = requests.Session()
+    # Retry only covers idempotent methods by default, so OpenRouter POSTs are never replayed
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# ========================================
+# JSON
+# ========================================
+
+_ORJSON_OPTS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC) if ORJSON_AVAILABLE else 0
+
+def _finite(obj):
+    """Replace non-finite floats with None, as orjson does (stdlib json would emit bare NaN)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+def _json_default(obj):
+    """Encode values the codecs don't handle natively (pandas Timestamps, numpy scalars/arrays)"""
+    if isinstance(obj, datetime):
+        # Match OPT_NAIVE_UTC: naive timestamps are taken to be UTC
+        return (obj.replace(tzinfo=timezone.utc) if obj.tzinfo is None else obj).isoformat()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):
+        return _finite(obj.tolist())
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def json_dumps_compact(obj) -> str:
+    """Serialize to whitespace-free JSON text, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS).decode('utf-8')
+    return json.dumps(_finite(obj), separators=(',', ':'), default=_json_default, allow_nan=False)
+
+def write_json(path: pathlib.Path, data):
+    """Atomically write data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTS | orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(_finite(data), indent=2, default=_json_default, allow_nan=False).encode('utf-8')
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+def strip_code_fence(content: str) -> str:
+    """Return the JSON inside a markdown code fence; bare JSON is returned unchanged"""
+    # response_format usually yields bare JSON, so skip the regex in the common case
+    if content.lstrip().startswith('{'):
+        return content
+    fence = _FENCE_RE.search(content)
+    return fence.group(1) if fence else content
+
+def link_or_copy(src: pathlib.Path, dst: pathlib.Path):
+    """Atomically make dst a hard link to src, copying where hard links aren't supported"""
+    tmp_path = dst.with_name(f'{dst.name}.tmp')
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+# ========================================
+# OpenRouter Requests
+# ========================================
+
+_MODEL_SENTINEL = '__MODEL__'
+
+def chat_body_template(messages, **options) -> bytes:
+    """Serialize a chat completion request once, with a placeholder where the model name goes"""
+    return json_dumps_compact({"model": _MODEL_SENTINEL, "messages": messages, **options}).encode('utf-8')
+
+def chat_body_for(body_template: bytes, model: str) -> bytes:
+    """Request bytes for one model from a chat_body_template result"""
+    # "model" is the first key, so the first placeholder match is always the model field
+    return body_template.replace(
+        json_dumps_compact(_MODEL_SENTINEL).encode('utf-8'), json_dumps_compact(model).encode('utf-8'), 1
+    )
+
+async def race_first(
+    candidates: Iterable[Any],
+    attempt: Callable[[Any], Awaitable[Any]],
+    width: int,
+    is_winner: Callable[[Any], bool] = bool,
+    is_fatal: Optional[Callable[[Any], bool]] = None,
+    stop: Optional[threading.Event] = None,
+) -> Optional[Any]:
+    """Run attempt(candidate) for up to width candidates at a time, refilling each freed
+    slot with the next candidate, and return the first result is_winner accepts.
+
+    Returns None once every candidate has failed or is_fatal flags a result. stop, if
+    given, is set when the race ends so attempts blocked on worker threads can give up.
+    """
+    candidates = iter(candidates)
+    pending = set()
+
+    def launch_next():
+        candidate = next(candidates, None)
+        if candidate is not None:
+            pending.add(asyncio.ensure_future(attempt(candidate)))
+
+    for _ in range(width):
+        launch_next()
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    # One attempt's unexpected failure must not end the race
+                    logger.warning(f"Race attempt failed unexpectedly: {e!r}")
+                    result = None
+                if result is not None and is_winner(result):
+                    return result
+                if result is not None and is_fatal and is_fatal(result):
+                    return None
+                launch_next()
+    finally:
+        # Cancelling only stops awaiting; threaded attempts exit once they see stop
+        if stop:
+            stop.set()
+        for task in pending:
+            task.cancel()
+
+    return None
+
+# ========================================
+# File Cache
+# ========================================
+
+_cache_locks = {}
+
+def cache_file(key: str, namespace: Optional[str] = None) -> pathlib.Path:
+    """Cache path for key: a short blake2b digest, optionally under a namespace subdirectory"""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    cache_dir = CACHE_DIR / namespace if namespace else CACHE_DIR
+    return cache_dir / f'{digest}.json'
+
+def cache_read(key: str, ttl: int, namespace: Optional[str] = None):
+    """Return cached data for key if younger than ttl seconds, else None"""
+    path = cache_file(key, namespace)
+    if path.exists():
+        try:
+            cached_entry = json_loads(path.read_bytes())
+            cache_time = datetime.fromisoformat(cached_entry['cached_at'])
+            if (datetime.now(timezone.utc) - cache_time).total_seconds() < ttl:
+                return cached_entry['data']
+        except (OSError, ValueError, KeyError):
+            pass
+    return None
+
+def cache_write(key: str, data, namespace: Optional[str] = None):
+    """Store data for key in CACHE_DIR (or a namespace subdirectory of it)"""
+    path = cache_file(key, namespace)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cache_data = {
+        'cached_at': datetime.now(timezone.utc).isoformat(),
+        'data': data
+    }
+    # Write to a private temp file and swap it in so readers never see a torn file
+    tmp_file = path.with_name(f'{path.stem}.{threading.get_ident()}.tmp')
+    tmp_file.write_text(json_dumps_compact(cache_data), encoding='utf-8')
+    os.replace(tmp_file, path)
+
+def cached(key: str, ttl: int, fn, namespace: Optional[str] = None):
+    """Return fn() memoized in CACHE_DIR for ttl seconds (empty results are not cached)"""
+    data = cache_read(key, ttl, namespace)
+    if data is not None:
+        return data
+
+    # One fetch per key at a time: concurrent callers wait and then reuse the fresh entry
+    with _cache_locks.setdefault((namespace, key), threading.Lock()):
+        data = cache_read(key, ttl, namespace)
+        if data is not None:
+            return data
+        data = fn()
+        if data:
+            cache_write(key, data, namespace)
+    return data
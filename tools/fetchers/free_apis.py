@@ -13,8 +13,11 @@ import pathlib
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
+
 import requests
 
+from fetch_utils import build_session, cached
+
 logger = logging.getLogger(__name__)
 
 # Paths
@@ -25,6 +28,9 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # Rate limiting tracking
 _rate_limits = defaultdict(lambda: {'count': 0, 'reset_time': 0})
 
+# Shared keep-alive session so repeated calls (e.g. the Hacker News item loop) reuse connections
+_session = build_session()
+
 # API Keys (from environment)
 FRED_API_KEY = os.environ.get('FRED_API_KEY')
 ALPHA_VANTAGE_KEY = os.environ.get('ALPHA_VANTAGE_KEY')
@@ -47,11 +53,11 @@ def fetch_fred_series(series_id: str, days: int = 365) -> Optional[List[Dict]]:
     # Check cache (refresh daily)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 86400:  # 24 hours
                 logger.info(f"  Using cached FRED data for {series_id}")
-                return cached.get('data')
+                return entry.get('data')
         except:
             pass
     
@@ -70,7 +76,7 @@ def fetch_fred_series(series_id: str, days: int = 365) -> Optional[List[Dict]]:
             'sort_order': 'desc'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -148,11 +154,11 @@ def fetch_eia_data(route: str, params: Dict = None) -> Optional[Dict]:
     # Check cache (refresh daily)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 86400:
                 logger.info(f"  Using cached EIA data for {route}")
-                return cached.get('data')
+                return entry.get('data')
         except:
             pass
             
@@ -161,7 +167,7 @@ def fetch_eia_data(route: str, params: Dict = None) -> Optional[Dict]:
         final_params = params.copy() if params else {}
         final_params['api_key'] = EIA_API_KEY
         
-        response = requests.get(url, params=final_params, timeout=15)
+        response = _session.get(url, params=final_params, timeout=15)
         response.raise_for_status()
         data = response.json()
         
@@ -215,11 +221,11 @@ def fetch_coingecko_data(coin_id: str = 'bitcoin') -> Optional[Dict]:
     # Check cache (refresh hourly for crypto)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 3600:  # 1 hour
                 logger.info(f"  Using cached CoinGecko data for {coin_id}")
-                return cached.get('data')
+                return entry.get('data')
         except:
             pass
     
@@ -238,7 +244,7 @@ def fetch_coingecko_data(coin_id: str = 'bitcoin') -> Optional[Dict]:
             'include_24hr_change': 'true'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -280,18 +286,23 @@ def get_crypto_metrics() -> Dict:
     if eth_data:
         metrics['eth'] = eth_data
     
-    # BTC Dominance
-    try:
-        url = "https://api.coingecko.com/api/v3/global"
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            metrics['btc_dominance'] = data.get('data', {}).get('market_cap_percentage', {}).get('btc', 0)
-    except:
-        pass
+    # BTC Dominance (refresh hourly for crypto)
+    btc_dominance = cached('coingecko_global', 3600, _fetch_btc_dominance)
+    if btc_dominance is not None:
+        metrics['btc_dominance'] = btc_dominance
     
     return metrics
 
+def _fetch_btc_dominance() -> Optional[float]:
+    """Fetch BTC market-cap dominance (%) from CoinGecko's /global endpoint"""
+    try:
+        response = _session.get("https://api.coingecko.com/api/v3/global", timeout=10)
+        if response.status_code == 200:
+            return response.json().get('data', {}).get('market_cap_percentage', {}).get('btc', 0)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"  Failed CoinGecko BTC dominance: {e}")
+    return None
+
 # ========================================
 # Alpha Vantage API
 # ========================================
@@ -309,11 +320,11 @@ def fetch_alpha_vantage(symbol: str, function: str = 'TIME_SERIES_DAILY') -> Opt
     # Check cache (refresh daily)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 86400:
                 logger.info(f"  Using cached Alpha Vantage data for {symbol}")
-                return cached.get('data')
+                return entry.get('data')
         except:
             pass
     
@@ -335,7 +346,7 @@ def fetch_alpha_vantage(symbol: str, function: str = 'TIME_SERIES_DAILY') -> Opt
             'outputsize': 'compact'
         }
         
-        response = requests.get(url, params=params, timeout=15)
+        response = _session.get(url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
         
@@ -372,21 +383,21 @@ def fetch_hackernews_top() -> List[Dict]:
     # Check cache (refresh every 30 minutes)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 1800:  # 30 min
-                return cached.get('data', [])
+                return entry.get('data', [])
         except:
             pass
     
     try:
         # Get top story IDs
-        response = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
+        response = _session.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
         story_ids = response.json()[:20]  # Top 20
         
         stories = []
         for story_id in story_ids[:10]:  # Limit to 10 to avoid rate limits
-            story_response = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5)
+            story_response = _session.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5)
             story = story_response.json()
             if story and story.get('type') == 'story':
                 stories.append({
@@ -422,15 +433,15 @@ def fetch_fear_greed_history(days: int = 30) -> List[Dict]:
     # Check cache (refresh daily)
     if cache_file.exists():
         try:
-            cached = json.loads(cache_file.read_text())
-            cache_time = datetime.fromisoformat(cached.get('cached_at', '2000-01-01'))
+            entry = json.loads(cache_file.read_text())
+            cache_time = datetime.fromisoformat(entry.get('cached_at', '2000-01-01'))
             if (datetime.now(timezone.utc) - cache_time).total_seconds() < 86400:
-                return cached.get('data', [])
+                return entry.get('data', [])
         except:
             pass
     
     try:
-        response = requests.get(f'https://api.alternative.me/fng/?limit={days}', timeout=10)
+        response = _session.get(f'https://api.alternative.me/fng/?limit={days}', timeout=10)
         data = response.json()
         
         history = []
@@ -18,6 +18,7 @@ import argparse
 import pathlib
 import time
 import asyncio
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -49,13 +50,20 @@ except ImportError:
 # Third-party imports
 try:
     import requests
-    import yfinance as yf
     import pandas as pd
     import numpy as np
 except ImportError as e:
     logger.error(f"Missing dependencies: {e}")
     sys.exit(1)
 
+# Add current directory to sys.path for local imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
+from fetch_utils import (
+    build_session, cache_read, cache_write, cached, json_loads, json_dumps_compact, write_json, link_or_copy,
+    strip_code_fence, chat_body_template, chat_body_for, race_first
+)
+from yf_cache import download_closes
+
 # ========================================
 # Client Classes
 # ========================================
@@ -63,21 +71,87 @@ except ImportError as e:
 # Check environment
 IS_LOCAL = os.environ.get("IS_LOCAL", "false").lower() == "true"
 
+# Number of OpenRouter models tried concurrently per API key
+AI_RACE_WIDTH = 4
+
+# Per-model success/failure record used to order and skip models across runs
+MODEL_HEALTH_FILE = CACHE_DIR / 'model_health.json'
+MODEL_COOLDOWN = 300  # seconds to skip a model after a 429, 5xx or timeout
+
+# On-disk cache lifetimes (seconds) for sources that update slowly
+CACHE_TTL = {
+    'fred': 6 * 3600,
+    'world_bank': 24 * 3600,
+    'arxiv': 3600,
+    'yfinance': 15 * 60,
+    'llm': 30 * 60,
+    'coingecko': 60,
+}
+
+# Request budgets (per minute) for rate-limited hosts
+RATE_LIMITS = {
+    'openrouter': 20,
+}
+
+class RateLimiter:
+    """Async token bucket keyed by host/API key"""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.refill_rate = rate_per_minute / 60.0
+        self._tokens = {}
+        self._last_update = {}
+        self._blocked_until = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, key: str):
+        """Wait until a request for key may be sent"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_update.get(key, now)
+                tokens = min(self.capacity, self._tokens.get(key, self.capacity) + elapsed * self.refill_rate)
+                self._last_update[key] = now
+                wait = self._blocked_until.get(key, 0) - now
+                if wait <= 0 and tokens >= 1:
+                    self._tokens[key] = tokens - 1
+                    return
+                self._tokens[key] = tokens
+                if wait <= 0:
+                    wait = (1 - tokens) / self.refill_rate
+            await asyncio.sleep(wait)
+
+    def defer(self, key: str, seconds: float):
+        """Hold off requests for key, e.g. to honor a Retry-After header"""
+        self._blocked_until[key] = max(self._blocked_until.get(key, 0), time.monotonic() + seconds)
+
+def _summarize_closes(closes: np.ndarray) -> Dict:
+    """Latest price and one-period change from an array of closing prices"""
+    price = float(closes[-1])
+    change_24h = float((closes[-1] - closes[-2]) / closes[-2]) if closes.size > 1 else 0.0
+    return {'price': price, 'change_24h': change_24h}
+
 class BaseClient:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = build_session()
 
-    def get_json(self, url: str, params: Dict = None, headers: Dict = None) -> Optional[Dict]:
+    def get_json(self, url: str, params: Dict = None, headers: Dict = None, cache_ttl: Optional[int] = None) -> Optional[Dict]:
         if IS_LOCAL and not self.api_key:
             logger.info(f"[Local Mode] Skipping API call to {url} (No Key)")
             return {}
-            
+
+        if cache_ttl:
+            cache_key = f"{url}|{sorted((params or {}).items())}"
+            return cached(cache_key, cache_ttl, lambda: self._request_json(url, params, headers))
+        return self._request_json(url, params, headers)
+
+    def _request_json(self, url: str, params: Dict = None, headers: Dict = None) -> Optional[Dict]:
         try:
             response = self.session.get(url, params=params, headers=headers, timeout=15)
             response.raise_for_status()
             return response.json()
-        except Exception as e:
+        except (requests.RequestException, ValueError) as e:
             logger.warning(f"Request failed for {url}: {e}")
             return None
 
@@ -96,7 +170,7 @@ class FREDClient(BaseClient):
             'sort_order': 'desc',
             'limit': limit
         }
-        data = self.get_json(self.base_url, params)
+        data = self.get_json(self.base_url, params, cache_ttl=CACHE_TTL['fred'])
         return data.get('observations', []) if data else []
 
 class AlphaVantageClient(BaseClient):
@@ -115,11 +189,11 @@ class CoinGeckoClient(BaseClient):
             'include_market_cap': 'true',
             'include_24hr_change': 'true'
         }
-        return self.get_json(f"{self.base_url}/simple/price", params) or {}
+        return self.get_json(f"{self.base_url}/simple/price", params, cache_ttl=CACHE_TTL['coingecko']) or {}
 
     def get_global_data(self) -> Dict:
         url = f"{self.base_url}/global"
-        return self.get_json(url)
+        return self.get_json(url, cache_ttl=CACHE_TTL['coingecko'])
 
 class NewsAPIClient(BaseClient):
     def __init__(self):
@@ -154,24 +228,41 @@ class CryptoCompareClient(BaseClient):
 
 class ArxivClient(BaseClient):
     def search(self, query: str, max_results: int = 5) -> List[Dict]:
-        import urllib.parse
+        return cached(f"arxiv|{query}|{max_results}", CACHE_TTL['arxiv'], lambda: self._search(query, max_results))
+
+    def _search(self, query: str, max_results: int) -> List[Dict]:
+        import itertools
         import xml.etree.ElementTree as ET
+        from urllib3.exceptions import HTTPError as Urllib3Error
         
-        url = f"http://export.arxiv.org/api/query?search_query={urllib.parse.quote(query)}&start=0&max_results={max_results}&sortBy=submittedDate&sortOrder=descending"
+        url = "http://export.arxiv.org/api/query"
+        params = {
+            'search_query': query,
+            'start': 0,
+            'max_results': max_results,
+            'sortBy': 'submittedDate',
+            'sortOrder': 'descending'
+        }
         try:
-            response = requests.get(url, timeout=20)
-            root = ET.fromstring(response.content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            papers = []
-            for entry in root.findall('atom:entry', ns):
-                papers.append({
-                    'title': entry.find('atom:title', ns).text.strip(),
-                    'summary': entry.find('atom:summary', ns).text.strip()[:200],
-                    'published': entry.find('atom:published', ns).text,
-                    'link': entry.find('atom:id', ns).text
-                })
+            # Parse straight off the socket so entries are handled while the feed is still arriving
+            with self.session.get(url, params=params, timeout=20, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                ns = {'atom': 'http://www.w3.org/2005/Atom'}
+                entry_tag = '{http://www.w3.org/2005/Atom}entry'
+                entries = (el for _, el in ET.iterparse(response.raw, events=('end',))
+                           if el.tag == entry_tag)
+                papers = []
+                for entry in itertools.islice(entries, max_results):
+                    papers.append({
+                        'title': entry.findtext('atom:title', '', ns).strip(),
+                        'summary': entry.findtext('atom:summary', '', ns).strip()[:200],
+                        'published': entry.findtext('atom:published', None, ns),
+                        'link': entry.findtext('atom:id', None, ns)
+                    })
+                    entry.clear()
             return papers
-        except Exception as e:
+        except (requests.RequestException, Urllib3Error, ET.ParseError) as e:
             logger.warning(f"Arxiv search failed: {e}")
             return []
 
@@ -179,7 +270,7 @@ class WorldBankClient(BaseClient):
     def get_gdp_growth(self, country_code: str = 'USA') -> Optional[float]:
         # Indicator: NY.GDP.MKTP.KD.ZG (GDP growth annual %)
         url = f"https://api.worldbank.org/v2/country/{country_code}/indicator/NY.GDP.MKTP.KD.ZG?format=json&per_page=1"
-        data = self.get_json(url)
+        data = self.get_json(url, cache_ttl=CACHE_TTL['world_bank'])
         if data and len(data) > 1 and data[1]:
             return data[1][0].get('value')
         return None
@@ -191,17 +282,26 @@ class GlassnodeClient(BaseClient):
 class CBOEClient(BaseClient):
     # Using Yahoo Finance as proxy for VIX/CBOE data
     def get_vix(self) -> Dict:
+        return cached("cboe|^VIX", CACHE_TTL['yfinance'], self._get_vix)
+
+    def _get_vix(self) -> Dict:
         try:
-            ticker = yf.Ticker("^VIX")
-            hist = ticker.history(period="5d")
-            if not hist.empty:
-                return {
-                    "current": hist['Close'].iloc[-1],
-                    "previous": hist['Close'].iloc[-2],
-                    "change": (hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2]
-                }
-        except Exception:
-            pass
+            close = download_closes(("^VIX",), "5d").get("^VIX")
+        except Exception as e:
+            # yfinance surfaces failures as assorted types (KeyError, YF*Error, ...); degrade to no VIX
+            logger.warning(f"VIX download failed: {e!r}")
+            return {}
+
+        if close is None:
+            return {}
+        closes = close.to_numpy()
+        if closes.size > 1:
+            summary = _summarize_closes(closes)
+            return {
+                "current": summary['price'],
+                "previous": float(closes[-2]),
+                "change": summary['change_24h']
+            }
         return {}
 
 class GeminiClient(BaseClient):
@@ -229,6 +329,158 @@ class GrokClient(BaseClient):
         # Placeholder for Grok data fetch
         return {}
 
+# ========================================
+# Prompt Templates
+# ========================================
+
+# Static parts of the unified analysis prompt. Only the data summary changes
+# between runs, so the schema is built once at import time.
+_PROMPT_HEADER = """Analyze this comprehensive market data and generate forecasts.
+
+DATA SUMMARY:
+"""
+
+_PROMPT_SCHEMA = """
+
+**CRITICAL INSTRUCTION**: Provide EXTREMELY DETAILED, VERBOSE, and INSIGHTFUL analysis. 
+Do not be brief. Write comprehensive paragraphs for all text fields. 
+The user wants "more text, more meaning, more insights".
+
+Generate JSON output matching the following schema EXACTLY. Do not deviate.
+Ensure ALL keys are present: "the_commander", "the_shield", "the_coin", "the_map", "the_frontier", "the_strategy", "the_library".
+IMPORTANT: Replace all value placeholders (like "string (...)") with your actual generated analysis and data.
+
+{
+    "the_commander": {
+        "metrics": [
+            { "name": "Flight to Safety", "value": "0-10", "signal": "Risk On/Off" },
+            { "name": "Market Sentiment", "value": "0-100", "signal": "Bearish/Bullish" }
+        ],
+        "flight_to_safety_score": { 
+            "current": 0.0-10.0, 
+            "trend": "string (e.g. 'Rising')", 
+            "3m_forecast": { "score": 0.0-10.0, "confidence": 0.0-1.0 } 
+        },
+        "asset_outlook": {
+            "BTC": { "risk_reward": "High/Medium/Low", "conviction": 0-10, "forecasts": { "3m": { "target": "price_string" } } },
+            "fed_rate": "string"
+        },
+        "morning_brief": {
+            "weather_of_the_day": "Sunny/Cloudy/Stormy/Foggy/Volatile",
+            "top_signal": "string (The single most important signal for today)",
+            "action_stance": "Aggressive/Neutral/Defensive",
+            "why_it_matters": "string (Explanation of the top signal)",
+            "cross_dashboard_convergence": "string (How signals from Shield, Coin, and Map align)",
+            "summary_sentence": "string (Executive summary sentence)"
+        },
+        "ai_analysis": "string (EXTREMELY DETAILED, MULTI-PARAGRAPH analysis of crypto market structure, on-chain data, and sentiment)"
+    },
+    "the_shield": {
+        "risk_assessment": { "score": 0.0-10.0, "level": "LOW/MEDIUM/HIGH", "color": "hex_code" },
+        "scoring": { "risk_level": 0-10, "fragility": 0.0-1.0, "volatility_pressure": 0.0-1.0 },
+        "metrics": [
+            { "name": "10Y Treasury Bid-to-Cover", "value": "string", "signal": "NORMAL" },
+            { "name": "USD/JPY", "value": "string", "signal": "NORMAL" },
+            { "name": "USD/CNH", "value": "string", "signal": "NORMAL" },
+            { "name": "10Y Treasury Yield", "value": "string", "signal": "NORMAL" },
+            { "name": "MOVE Index", "value": "string", "signal": "NORMAL" },
+            { "name": "VIX", "value": "string", "signal": "ELEVATED" },
+            { "name": "Fear & Greed", "value": "string", "signal": "Fear" }
+        ],
+        "ai_analysis": "string (EXTREMELY DETAILED analysis of global risk pressure, cross-asset stress, and volatility clusters)",
+        "data_sources": ["string"]
+    },
+    "the_coin": {
+        "metrics": [
+            { "name": "BTC Price", "value": "string", "signal": "NORMAL" },
+            { "name": "ETH Price", "value": "string", "signal": "NORMAL" },
+            { "name": "RSI (BTC)", "value": "string", "signal": "NORMAL" },
+            { "name": "Fear & Greed", "value": "string", "signal": "EXTREME FEAR" },
+            { "name": "DXY Index", "value": "string", "signal": "NORMAL" },
+            { "name": "Fed Rate", "value": "string", "signal": "NORMAL" }
+        ],
+        "crypto_assets": {
+            "BTC": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 },
+            "ETH": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 },
+            "VXV": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 },
+            "APT": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 },
+            "ADA": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 },
+            "NEAR": { "price": 0.0, "risk": 0.0, "multiplier": 0.0 }
+        },
+        "composite_risk": 0.0,
+        "risk_level": "string",
+        "momentum": "string",
+        "key_level": "string",
+        "rsi": 0.0,
+        "trend": "string",
+        "fear_and_greed": { "value": 0, "classification": "string" },
+        "ai_analysis": "string (EXTREMELY DETAILED analysis of crypto momentum, rotation, and setup quality)"
+    },
+    "the_map": {
+        "scoring": { "stance_strength": 0, "volatility_risk": 0, "confidence": 0.0 },
+        "metrics": [
+            { "name": "S&P 500", "value": "string", "signal": "NORMAL" },
+            { "name": "TASI", "value": "string", "signal": "NEUTRAL" },
+            { "name": "Oil (Brent)", "value": "string", "signal": "NORMAL" },
+            { "name": "Gold", "value": "string", "signal": "NORMAL" },
+            { "name": "DXY", "value": "string", "signal": "NORMAL" },
+            { "name": "10Y Yield", "value": "string", "signal": "NORMAL" }
+        ],
+        "macro": { "oil": 0.0, "dxy": 0.0, "gold": 0.0, "sp500": 0.0, "tasi": 0.0, "treasury_10y": 0.0 },
+        "tasi_mood": "string",
+        "drivers": ["string"],
+        "ai_analysis": "string (EXTREMELY DETAILED analysis of global macro and Saudi market)",
+        "data_sources": ["string"]
+    },
+    "the_frontier": {
+        "scoring": { "breakthrough_score": 0, "trajectory": 0.0, "future_pull": 0.0 },
+        "metrics": [
+            { "name": "AI Research", "value": "string", "signal": "ACTIVE" },
+            { "name": "Advanced Manufacturing", "value": "string", "signal": "ACTIVE" },
+            { "name": "Biotechnology", "value": "string", "signal": "ACTIVE" },
+            { "name": "Quantum Computing", "value": "string", "signal": "ACTIVE" },
+            { "name": "Semiconductors", "value": "string", "signal": "ACTIVE" }
+        ],
+        "domains": {
+            "AI Research": { "total_volume": 0, "recent_papers": [ { "title": "string", "summary": "string", "date": "string", "link": "string" } ] },
+            "Advanced Manufacturing": { "total_volume": 0, "recent_papers": [] },
+            "Biotechnology": { "total_volume": 0, "recent_papers": [] },
+            "Quantum Computing": { "total_volume": 0, "recent_papers": [] },
+            "Semiconductors": { "total_volume": 0, "recent_papers": [] }
+        },
+        "breakthroughs": [ { "title": "string", "why_it_matters": "string" } ],
+        "ai_analysis": "string (EXTREMELY DETAILED analysis of AI progress and workforce impact)",
+        "data_sources": ["string"]
+    },
+    "the_strategy": {
+        "scoring": { "stance_confidence": 0 },
+        "metrics": [
+            { "name": "Risk Input", "value": "string", "signal": "CAUTION" },
+            { "name": "Crypto Input", "value": "string", "signal": "BEARISH" },
+            { "name": "Macro Input", "value": "string", "signal": "NEUTRAL" },
+            { "name": "Frontier Input", "value": "string", "signal": "NORMAL" }
+        ],
+        "stance": "string",
+        "mindset": "string",
+        "inputs": { "risk": "string", "crypto": "string", "macro": "string", "frontier": "string" },
+        "ai_analysis": "string (EXTREMELY DETAILED analysis of investment strategy and opportunities)",
+        "data_sources": ["string"]
+    },
+    "the_library": {
+        "metrics": [],
+        "query": "What drives crypto bull markets?",
+        "simplified_answer": "string (Provide a comprehensive, easy-to-understand explanation)",
+        "related_commander_insights": {
+            "current_outlook": "string",
+            "forecast": "string"
+        },
+        "further_reading": [
+            { "title": "string", "source": "string" }
+        ]
+    }
+}
+"""
+
 # ========================================
 # Unified Fetcher V4
 # ========================================
@@ -282,12 +534,72 @@ class UnifiedFetcherV4:
             "alibaba/tongyi-deepresearch-30b-a3b:free"
         ]
         
-        self.historical_data = {}
         self.current_metrics = {}
         self.sentiment_scores = {}
         self.ai_metrics = {}
         
-    def fetch_historical(self, lookback_days=90):
+        # Token bucket per OpenRouter key instead of fixed sleeps between calls
+        self.rate_limiter = RateLimiter(RATE_LIMITS['openrouter'])
+        self.model_health = self._load_model_health()
+        
+        # Shared keep-alive session for OpenRouter and ad-hoc requests
+        self.session = build_session()
+        
+        # Single bounded pool for every blocking call dispatched from async code
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='fetcher')
+
+    async def _run_blocking(self, fn, *args):
+        """Run a blocking callable on the shared fetcher thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+        
+    @staticmethod
+    def _download_closes(symbols: List[str], lookback_days: int) -> Dict[str, pd.Series]:
+        """Fetch closing prices for many tickers in one batched request (blocking, disk-cached)"""
+        period = f"{lookback_days}d"
+        closes_cache = {symbol: cache_read(f"yfinance|{symbol}|{period}", CACHE_TTL['yfinance']) for symbol in symbols}
+        missing = [symbol for symbol, data in closes_cache.items() if data is None]
+
+        if missing:
+            for symbol, close in download_closes(tuple(missing), period).items():
+                data = {
+                    'index': [ts.isoformat() for ts in close.index],
+                    'close': close.tolist()
+                }
+                cache_write(f"yfinance|{symbol}|{period}", data)
+                closes_cache[symbol] = data
+
+        return {
+            symbol: pd.Series(data['close'], index=pd.to_datetime(data['index']), dtype=float)
+            for symbol, data in closes_cache.items() if data
+        }
+
+    @staticmethod
+    def _compute_indicators(closes: np.ndarray, window: int = 14) -> Dict:
+        """RSI, SMA and volatility over the latest window of closes.
+
+        Only the most recent value of each indicator is reported, so just the
+        last window is computed rather than a full rolling series.
+        """
+        if closes.size < window:
+            return {'rsi': 50.0}
+
+        recent = closes[-(window + 1):]
+        delta = np.diff(recent)
+        gain = delta[delta > 0].sum() / window
+        loss = -delta[delta < 0].sum() / window
+        if loss > 0:
+            rsi = 100 - (100 / (1 + gain / loss))
+        else:
+            rsi = 100.0 if gain > 0 else 50.0
+
+        return {
+            'rsi': float(rsi),
+            'sma_14': float(closes[-window:].mean()),
+            'volatility_14d': float((delta / recent[:-1]).std())
+        }
+
+    async def fetch_historical(self, lookback_days=90):
         """Fetch 90 days of data for trend analysis"""
         logger.info(f"Fetching {lookback_days} days of historical data...")
         
@@ -315,46 +627,42 @@ class UnifiedFetcherV4:
             'CBON': 'CBON'
         }
 
+        # One batched download for every ticker, overlapped with the independent crypto APIs
+        closes_by_symbol, cc_data, global_data, fng_data = await asyncio.gather(
+            self._run_blocking(self._download_closes, list(assets.values()), lookback_days),
+            self._run_blocking(self.data_sources['cryptocompare'].get_top_market_cap, 10),
+            self._run_blocking(self.data_sources['coingecko'].get_global_data),
+            self._run_blocking(self._fetch_fear_greed),
+            return_exceptions=True
+        )
+        if isinstance(closes_by_symbol, Exception):
+            logger.warning(f"Failed to fetch historical data: {closes_by_symbol}")
+            closes_by_symbol = {}
+
         for name, symbol in assets.items():
+            close = closes_by_symbol.get(symbol)
+            if close is None:
+                logger.warning(f"Failed to fetch history for {name}: no data returned")
+                continue
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=f"{lookback_days}d")
-                self.historical_data[name] = hist['Close'].to_dict()
-                
-                if not hist.empty:
-                    # Calculate basic metrics
-                    current_price = hist['Close'].iloc[-1]
-                    prev_price = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-                    change_24h = (current_price - prev_price) / prev_price
-                    
-                    # Calculate RSI (simple approximation)
-                    rsi = 50.0
-                    if len(hist) >= 14:
-                        delta = hist['Close'].diff()
-                        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                        rs = gain / loss
-                        rsi = 100 - (100 / (1 + rs))
-                        rsi = rsi.iloc[-1]
-                        if pd.isna(rsi): rsi = 50.0
-
+                closes = close.to_numpy()
+                if closes.size:
+                    # Calculate basic metrics and indicators
                     self.current_metrics[name] = {
-                        'price': current_price,
-                        'change_24h': change_24h,
-                        'rsi': rsi
+                        **_summarize_closes(closes),
+                        **self._compute_indicators(closes)
                     }
             except Exception as e:
                 logger.warning(f"Failed to fetch history for {name}: {e}")
 
         # 3. VIX (Fallback if not fetched above)
         if 'VIX' not in self.current_metrics:
-            vix = self.data_sources['cboe'].get_vix()
+            vix = await self._run_blocking(self.data_sources['cboe'].get_vix)
             if vix:
                 self.current_metrics['VIX'] = vix
 
         # 4. CryptoCompare Data (Top 10)
-        cc_data = self.data_sources['cryptocompare'].get_top_market_cap(limit=10)
-        if cc_data and 'Data' in cc_data:
+        if isinstance(cc_data, dict) and 'Data' in cc_data:
             self.current_metrics['top_crypto'] = [
                 {
                     'symbol': coin['CoinInfo']['Name'],
@@ -373,8 +681,7 @@ class UnifiedFetcherV4:
                 self.current_metrics['ETH/BTC'] = eth_price / btc_price
                 
             # Estimate BTC Dominance and Alts Strength
-            global_data = self.data_sources['coingecko'].get_global_data()
-            if global_data and 'data' in global_data:
+            if isinstance(global_data, dict) and 'data' in global_data:
                 market_cap_percentage = global_data['data'].get('market_cap_percentage', {})
                 btc_d = market_cap_percentage.get('btc')
                 
@@ -386,20 +693,28 @@ class UnifiedFetcherV4:
             logger.warning(f"Failed to calculate derived metrics: {e}")
 
         # 6. Fear and Greed (Alternative.me)
-        try:
-            fng_response = requests.get("https://api.alternative.me/fng/?limit=1")
-            if fng_response.ok:
-                fng_data = fng_response.json()
-                self.current_metrics['FearGreed'] = fng_data['data'][0]
-        except Exception as e:
-            logger.warning(f"Failed to fetch Fear & Greed: {e}")
+        if isinstance(fng_data, Exception):
+            logger.warning(f"Failed to fetch Fear & Greed: {fng_data}")
+        elif fng_data:
+            self.current_metrics['FearGreed'] = fng_data
 
-    def calculate_agi_metrics(self):
+    def _fetch_fear_greed(self) -> Dict:
+        """Latest Fear & Greed reading from Alternative.me (blocking)"""
+        fng_response = self.session.get("https://api.alternative.me/fng/?limit=1", timeout=15)
+        if not fng_response.ok:
+            return {}
+        fng_data = fng_response.json()
+        # Drop the ticking 'time_until_update' countdown so the summary stays stable between runs
+        return {k: v for k, v in fng_data['data'][0].items() if k != 'time_until_update'}
+
+    async def calculate_agi_metrics(self):
         """Scrape AI research velocity and compute escape velocity probability"""
         logger.info("Calculating AGI metrics...")
         
         # Fetch Arxiv papers
-        papers = self.data_sources['arxiv'].search("artificial general intelligence OR large language models", max_results=10)
+        papers = await self._run_blocking(
+            self.data_sources['arxiv'].search, "artificial general intelligence OR large language models", 10
+        )
         
         # Simple heuristic for "velocity" based on recent paper count (mocked for now as we only fetch 10)
         # In a real scenario, we'd query for total count in last month
@@ -411,8 +726,160 @@ class UnifiedFetcherV4:
             'compute_scaling': 'Exponential'
         }
 
-    async def call_ai_ensemble(self, prompt: str) -> Dict:
-        """Call AI models with fallback using multiple API keys"""
+    @staticmethod
+    def _build_body_template(prompt: str) -> bytes:
+        """Serialize the request body once, with a placeholder where the model name goes"""
+        return chat_body_template(
+            [
+                {"role": "system", "content": "You are a senior financial analyst and AGI researcher. Output strictly valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.2,
+            response_format={"type": "json_object"}
+        )
+
+    def _try_model(self, headers: Dict, model: str, body_template: bytes,
+                   stop: Optional[threading.Event] = None):
+        """Call a single OpenRouter model (blocking).
+
+        Returns (status_code, data, retry_after) where data is the parsed analysis
+        or None, and retry_after is the server's requested backoff on a 429. Gives up
+        with (None, None, None) as soon as stop is set.
+        """
+        if stop and stop.is_set():
+            return None, None, None
+        logger.info(f"Calling AI model: {model}")
+        body = chat_body_for(body_template, model)
+
+        try:
+            # Read the body in chunks so a decided race can drop this request mid-response
+            with self.session.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers=headers,
+                data=body,
+                stream=True,
+                timeout=60
+            ) as response:
+                chunks = []
+                for chunk in response.iter_content(chunk_size=16384):
+                    if stop and stop.is_set():
+                        # Another model already won; leaving the block closes the connection
+                        return None, None, None
+                    chunks.append(chunk)
+                payload = b''.join(chunks)
+        except requests.RequestException as e:
+            logger.warning(f"Error calling {model}: {e}")
+            return None, None, None
+
+        if response.status_code == 200:
+            try:
+                content = json_loads(payload)['choices'][0]['message']['content']
+                if not isinstance(content, str):
+                    # Reasoning models can answer with null content
+                    raise TypeError(f"content is {type(content).__name__}")
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                logger.warning(f"Model {model} returned a malformed response envelope: {e!r}")
+                return response.status_code, None, None
+
+            content = strip_code_fence(content)
+
+            try:
+                data = json_loads(content)
+            except json.JSONDecodeError as je:
+                logger.warning(f"Model {model} returned invalid JSON: {je}")
+                return response.status_code, None, None
+
+            # Basic validation before returning
+            required_keys = ['the_commander', 'the_shield', 'the_map', 'the_coin']
+            missing_keys = [k for k in required_keys if not isinstance(data, dict) or k not in data]
+
+            if missing_keys:
+                logger.warning(f"Model {model} returned incomplete JSON. Missing: {missing_keys}")
+                return response.status_code, None, None
+
+            logger.info(f"Successfully received analysis from {model}")
+            return response.status_code, data, None
+
+        elif response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get('retry-after', 5))
+            except ValueError:
+                retry_after = 5.0
+            logger.warning(f"Model {model} rate limited (429). Backing off {retry_after:.0f}s...")
+            return response.status_code, None, retry_after
+        elif response.status_code not in [401, 402, 403]:
+            logger.warning(f"Model {model} failed with status {response.status_code}: {payload[:200].decode('utf-8', errors='replace')}")
+
+        return response.status_code, None, None
+
+    async def _attempt_model(self, headers: Dict, model: str, body_template: bytes, limiter_key: str,
+                             stop: threading.Event):
+        """Wait for rate-limit capacity, then call one model on the fetcher pool"""
+        await self.rate_limiter.acquire(limiter_key)
+        status, data, retry_after = await self._run_blocking(self._try_model, headers, model, body_template, stop)
+        if stop.is_set() and not data:
+            # Abandoned because another model won; says nothing about this model's health
+            return status, data
+        if retry_after:
+            self.rate_limiter.defer(limiter_key, retry_after)
+
+        health = self.model_health.setdefault(model, {})
+        if data:
+            health['last_ok'] = time.time()
+        elif status is None or status == 429 or status >= 500:
+            health['cooldown_until'] = time.time() + MODEL_COOLDOWN
+        return status, data
+
+    @staticmethod
+    def _load_model_health() -> Dict:
+        try:
+            return json_loads(MODEL_HEALTH_FILE.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_model_health(self):
+        try:
+            write_json(MODEL_HEALTH_FILE, self.model_health)
+        except OSError as e:
+            logger.warning(f"Could not save model health: {e}")
+
+    def _models_by_health(self) -> List[str]:
+        """Models outside their cooldown, most recently successful first"""
+        now = time.time()
+        models = [m for m in self.ai_models if self.model_health.get(m, {}).get('cooldown_until', 0) <= now]
+        if not models:
+            # Everything is cooling down; trying them beats giving up
+            models = list(self.ai_models)
+        # Stable sort: models that never succeeded keep their configured order
+        return sorted(models, key=lambda m: -self.model_health.get(m, {}).get('last_ok', 0))
+
+    async def _race_models(self, headers: Dict, body_template: bytes, key_index: int) -> Optional[Dict]:
+        """Race up to AI_RACE_WIDTH models at a time; the first valid analysis wins"""
+        def key_rejected(outcome) -> bool:
+            status, _ = outcome
+            if status in [401, 402, 403]:
+                logger.warning(f"Key #{key_index + 1} failed with status {status}. Switching to next key...")
+                return True
+            return False
+
+        # Set once the race is decided so losing requests stop reading their responses
+        stop = threading.Event()
+        winner = await race_first(
+            self._models_by_health(),
+            lambda model: self._attempt_model(headers, model, body_template, f"openrouter:{key_index}", stop),
+            AI_RACE_WIDTH,
+            is_winner=lambda outcome: bool(outcome[1]),
+            is_fatal=key_rejected,
+            stop=stop
+        )
+        return winner[1] if winner else None
+
+    async def call_ai_ensemble(self, prompt: str, cache_key: Optional[str] = None) -> Dict:
+        """Call AI models with fallback using multiple API keys
+
+        Successful responses are cached for 30 minutes, keyed by the model list and
+        cache_key (defaults to the prompt), so identical inputs skip the LLM entirely.
+        """
         # Get all available keys
         api_keys = [
             k for k in [
@@ -431,6 +898,15 @@ class UnifiedFetcherV4:
 
         logger.info(f"Found {len(api_keys)} API key(s) available for use.")
 
+        llm_key = '|'.join(sorted(self.ai_models)) + '|' + (cache_key if cache_key is not None else prompt)
+        cached_analysis = await self._run_blocking(cache_read, llm_key, CACHE_TTL['llm'], 'llm')
+        if cached_analysis:
+            logger.info("Using cached AI analysis for identical inputs.")
+            return cached_analysis
+
+        # Every model and key sends the same body apart from the model name
+        body_template = self._build_body_template(prompt)
+
         for key_index, api_key in enumerate(api_keys):
             logger.info(f"Attempting with API Key #{key_index + 1}")
             
@@ -441,67 +917,13 @@ class UnifiedFetcherV4:
                 "X-Title": "Daily Alpha Loop"
             }
 
-            for model in self.ai_models:
+            data = await self._race_models(headers, body_template, key_index)
+            if data:
                 try:
-                    logger.info(f"Calling AI model: {model}")
-                    payload = {
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": "You are a senior financial analyst and AGI researcher. Output strictly valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.2,
-                        "response_format": {"type": "json_object"}
-                    }
-                    
-                    response = requests.post(
-                        "https://openrouter.ai/api/v1/chat/completions",
-                        headers=headers,
-                        json=payload,
-                        timeout=60
-                    )
-                    
-                    if response.status_code == 200:
-                        content = response.json()['choices'][0]['message']['content']
-                        # Clean markdown code blocks if present
-                        if "```json" in content:
-                            content = content.split("```json")[1].split("```")[0].strip()
-                        elif "```" in content:
-                            content = content.split("```")[1].split("```")[0].strip()
-                        
-                        try:
-                            data = json.loads(content)
-                            # Basic validation before returning
-                            required_keys = ['the_commander', 'the_shield', 'the_map', 'the_coin']
-                            missing_keys = [k for k in required_keys if k not in data]
-                            
-                            if missing_keys:
-                                logger.warning(f"Model {model} returned incomplete JSON. Missing: {missing_keys}")
-                                # Optional: Retry logic could go here, but for now we just skip this model result
-                                continue
-                                
-                            logger.info(f"Successfully received analysis from {model}")
-                            return data
-                        except json.JSONDecodeError as je:
-                            logger.warning(f"Model {model} returned invalid JSON: {je}")
-                            continue
-                    
-                    elif response.status_code in [401, 402, 403]:
-                        logger.warning(f"Key #{key_index + 1} failed with status {response.status_code}. Switching to next key...")
-                        break # Break model loop to try next key
-                        
-                    elif response.status_code == 429:
-                        logger.warning(f"Model {model} rate limited (429). Waiting 5s...")
-                        time.sleep(5)
-                    else:
-                        logger.warning(f"Model {model} failed with status {response.status_code}: {response.text[:200]}")
-                
-                except Exception as e:
-                    logger.warning(f"Error calling {model}: {e}")
-                    continue
-                
-                # Small delay between models to be nice
-                time.sleep(1)
+                    await self._run_blocking(cache_write, llm_key, data, 'llm')
+                except OSError as e:
+                    logger.warning(f"Could not cache AI analysis: {e}")
+                return data
             
             logger.warning(f"All models failed with Key #{key_index + 1}. Trying next key if available...")
         
@@ -638,159 +1060,20 @@ class UnifiedFetcherV4:
 
         logger.info("Generating unified analysis...")
         
-        # Prepare data summary for AI
-        data_summary = {
+        # Compact form: the model doesn't need pretty-printing and whitespace costs tokens
+        metrics = {
             "market_metrics": self.current_metrics,
-            "ai_research": self.ai_metrics,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "ai_research": self.ai_metrics
         }
+        prompt = (
+            _PROMPT_HEADER
+            + json_dumps_compact({**metrics, "timestamp": datetime.now(timezone.utc).isoformat()})
+            + _PROMPT_SCHEMA
+        )
         
-        prompt = f"""
-        Analyze this comprehensive market data and generate forecasts.
-        
-        DATA SUMMARY:
-        {json.dumps(data_summary, indent=2)}
-        
-        **CRITICAL INSTRUCTION**: Provide EXTREMELY DETAILED, VERBOSE, and INSIGHTFUL analysis. 
-        Do not be brief. Write comprehensive paragraphs for all text fields. 
-        The user wants "more text, more meaning, more insights".
-        
-        Generate JSON output matching the following schema EXACTLY. Do not deviate.
-        Ensure ALL keys are present: "the_commander", "the_shield", "the_coin", "the_map", "the_frontier", "the_strategy", "the_library".
-        IMPORTANT: Replace all value placeholders (like "string (...)") with your actual generated analysis and data.
-        
-        {{
-            "the_commander": {{
-                "metrics": [
-                    {{ "name": "Flight to Safety", "value": "0-10", "signal": "Risk On/Off" }},
-                    {{ "name": "Market Sentiment", "value": "0-100", "signal": "Bearish/Bullish" }}
-                ],
-                "flight_to_safety_score": {{ 
-                    "current": 0.0-10.0, 
-                    "trend": "string (e.g. 'Rising')", 
-                    "3m_forecast": {{ "score": 0.0-10.0, "confidence": 0.0-1.0 }} 
-                }},
-                "asset_outlook": {{
-                    "BTC": {{ "risk_reward": "High/Medium/Low", "conviction": 0-10, "forecasts": {{ "3m": {{ "target": "price_string" }} }} }},
-                    "fed_rate": "string"
-                }},
-                "morning_brief": {{
-                    "weather_of_the_day": "Sunny/Cloudy/Stormy/Foggy/Volatile",
-                    "top_signal": "string (The single most important signal for today)",
-                    "action_stance": "Aggressive/Neutral/Defensive",
-                    "why_it_matters": "string (Explanation of the top signal)",
-                    "cross_dashboard_convergence": "string (How signals from Shield, Coin, and Map align)",
-                    "summary_sentence": "string (Executive summary sentence)"
-                }},
-                "ai_analysis": "string (EXTREMELY DETAILED, MULTI-PARAGRAPH analysis of crypto market structure, on-chain data, and sentiment)"
-            }},
-            "the_shield": {{
-                "risk_assessment": {{ "score": 0.0-10.0, "level": "LOW/MEDIUM/HIGH", "color": "hex_code" }},
-                "scoring": {{ "risk_level": 0-10, "fragility": 0.0-1.0, "volatility_pressure": 0.0-1.0 }},
-                "metrics": [
-                    {{ "name": "10Y Treasury Bid-to-Cover", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "USD/JPY", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "USD/CNH", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "10Y Treasury Yield", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "MOVE Index", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "VIX", "value": "string", "signal": "ELEVATED" }},
-                    {{ "name": "Fear & Greed", "value": "string", "signal": "Fear" }}
-                ],
-                "ai_analysis": "string (EXTREMELY DETAILED analysis of global risk pressure, cross-asset stress, and volatility clusters)",
-                "data_sources": ["string"]
-            }},
-            "the_coin": {{
-                "metrics": [
-                    {{ "name": "BTC Price", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "ETH Price", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "RSI (BTC)", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "Fear & Greed", "value": "string", "signal": "EXTREME FEAR" }},
-                    {{ "name": "DXY Index", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "Fed Rate", "value": "string", "signal": "NORMAL" }}
-                ],
-                "crypto_assets": {{
-                    "BTC": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }},
-                    "ETH": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }},
-                    "VXV": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }},
-                    "APT": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }},
-                    "ADA": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }},
-                    "NEAR": {{ "price": 0.0, "risk": 0.0, "multiplier": 0.0 }}
-                }},
-                "composite_risk": 0.0,
-                "risk_level": "string",
-                "momentum": "string",
-                "key_level": "string",
-                "rsi": 0.0,
-                "trend": "string",
-                "fear_and_greed": {{ "value": 0, "classification": "string" }},
-                "ai_analysis": "string (EXTREMELY DETAILED analysis of crypto momentum, rotation, and setup quality)"
-            }},
-            "the_map": {{
-                "scoring": {{ "stance_strength": 0, "volatility_risk": 0, "confidence": 0.0 }},
-                "metrics": [
-                    {{ "name": "S&P 500", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "TASI", "value": "string", "signal": "NEUTRAL" }},
-                    {{ "name": "Oil (Brent)", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "Gold", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "DXY", "value": "string", "signal": "NORMAL" }},
-                    {{ "name": "10Y Yield", "value": "string", "signal": "NORMAL" }}
-                ],
-                "macro": {{ "oil": 0.0, "dxy": 0.0, "gold": 0.0, "sp500": 0.0, "tasi": 0.0, "treasury_10y": 0.0 }},
-                "tasi_mood": "string",
-                "drivers": ["string"],
-                "ai_analysis": "string (EXTREMELY DETAILED analysis of global macro and Saudi market)",
-                "data_sources": ["string"]
-            }},
-            "the_frontier": {{
-                "scoring": {{ "breakthrough_score": 0, "trajectory": 0.0, "future_pull": 0.0 }},
-                "metrics": [
-                    {{ "name": "AI Research", "value": "string", "signal": "ACTIVE" }},
-                    {{ "name": "Advanced Manufacturing", "value": "string", "signal": "ACTIVE" }},
-                    {{ "name": "Biotechnology", "value": "string", "signal": "ACTIVE" }},
-                    {{ "name": "Quantum Computing", "value": "string", "signal": "ACTIVE" }},
-                    {{ "name": "Semiconductors", "value": "string", "signal": "ACTIVE" }}
-                ],
-                "domains": {{
-                    "AI Research": {{ "total_volume": 0, "recent_papers": [ {{ "title": "string", "summary": "string", "date": "string", "link": "string" }} ] }},
-                    "Advanced Manufacturing": {{ "total_volume": 0, "recent_papers": [] }},
-                    "Biotechnology": {{ "total_volume": 0, "recent_papers": [] }},
-                    "Quantum Computing": {{ "total_volume": 0, "recent_papers": [] }},
-                    "Semiconductors": {{ "total_volume": 0, "recent_papers": [] }}
-                }},
-                "breakthroughs": [ {{ "title": "string", "why_it_matters": "string" }} ],
-                "ai_analysis": "string (EXTREMELY DETAILED analysis of AI progress and workforce impact)",
-                "data_sources": ["string"]
-            }},
-            "the_strategy": {{
-                "scoring": {{ "stance_confidence": 0 }},
-                "metrics": [
-                    {{ "name": "Risk Input", "value": "string", "signal": "CAUTION" }},
-                    {{ "name": "Crypto Input", "value": "string", "signal": "BEARISH" }},
-                    {{ "name": "Macro Input", "value": "string", "signal": "NEUTRAL" }},
-                    {{ "name": "Frontier Input", "value": "string", "signal": "NORMAL" }}
-                ],
-                "stance": "string",
-                "mindset": "string",
-                "inputs": {{ "risk": "string", "crypto": "string", "macro": "string", "frontier": "string" }},
-                "ai_analysis": "string (EXTREMELY DETAILED analysis of investment strategy and opportunities)",
-                "data_sources": ["string"]
-            }},
-            "the_library": {{
-                "metrics": [],
-                "query": "What drives crypto bull markets?",
-                "simplified_answer": "string (Provide a comprehensive, easy-to-understand explanation)",
-                "related_commander_insights": {{
-                    "current_outlook": "string",
-                    "forecast": "string"
-                }},
-                "further_reading": [
-                    {{ "title": "string", "source": "string" }}
-                ]
-            }}
-        }}
-        """
-        
-        return await self.call_ai_ensemble(prompt)
+        # The timestamp changes every run; leave it out of the cache key so unchanged data hits
+        metrics_json = json_dumps_compact(metrics)
+        return await self.call_ai_ensemble(prompt, cache_key=_PROMPT_SCHEMA + metrics_json)
 
     def validate_data(self, data: Dict) -> bool:
         """Validate that critical data is present before saving"""
@@ -806,8 +1089,22 @@ class UnifiedFetcherV4:
                 
         return True
 
-    def save_dashboard_data(self, analysis_result: Dict):
-        """Save distributed data to respective dashboard folders"""
+    def _write_dashboard(self, folder: str, data: Dict):
+        """Write one dashboard's data.json and latest.json (blocking)"""
+        # Ensure directory exists
+        target_dir = DATA_DIR / folder
+        target_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Save data.json (Primary)
+        write_json(target_dir / 'data.json', data)
+        
+        # Save latest.json (Legacy/Backup) as a link to the same content
+        link_or_copy(target_dir / 'data.json', target_dir / 'latest.json')
+            
+        logger.info(f"Saved data for {folder} (data.json & latest.json)")
+
+    async def save_dashboard_data(self, analysis_result: Dict):
+        """Save distributed data to respective dashboard folders concurrently"""
         if not analysis_result:
             logger.error("No analysis result to save")
             return
@@ -870,6 +1167,7 @@ class UnifiedFetcherV4:
             norm_key = k.lower().replace(' ', '_')
             normalized_result[norm_key] = v
 
+        writes = []
         for key, folder in dashboard_map.items():
             # Check for exact match or normalized match
             data = normalized_result.get(key)
@@ -888,41 +1186,35 @@ class UnifiedFetcherV4:
                 else:
                     data['name'] = "Dashboard"
                 
-                # Ensure directory exists
-                target_dir = DATA_DIR / folder
-                target_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Save data.json (Primary)
-                with open(target_dir / 'data.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-                
-                # Save latest.json (Legacy/Backup)
-                with open(target_dir / 'latest.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-                    
-                logger.info(f"Saved data for {folder} (data.json & latest.json)")
+                writes.append(self._run_blocking(self._write_dashboard, folder, data))
+
+        # Dashboards are independent files, so write them all at once
+        await asyncio.gather(*writes)
 
     async def run(self):
         """Main execution flow"""
         logger.info("Starting Unified Fetcher V4...")
         
-        # 1. Fetch Data
-        self.fetch_historical()
-        self.calculate_agi_metrics()
-        
-        # 2. Generate Analysis
-        analysis = await self.unified_analysis()
-        
-        # 3. Validate Data (Production Only)
-        if not IS_LOCAL:
-            if not self.validate_data(analysis):
-                logger.error("Data validation failed in production! Aborting save.")
-                return
-
-        # 4. Save Results
-        self.save_dashboard_data(analysis)
-        
-        logger.info("Unified Fetcher V4 completed successfully.")
+        try:
+            # 1. Fetch Data (independent sources, fetched concurrently)
+            await asyncio.gather(self.fetch_historical(), self.calculate_agi_metrics())
+            
+            # 2. Generate Analysis
+            analysis = await self.unified_analysis()
+            
+            # 3. Validate Data (Production Only)
+            if not IS_LOCAL:
+                if not self.validate_data(analysis):
+                    logger.error("Data validation failed in production! Aborting save.")
+                    return
+
+            # 4. Save Results
+            await self.save_dashboard_data(analysis)
+            
+            logger.info("Unified Fetcher V4 completed successfully.")
+        finally:
+            self._save_model_health()
+            self._executor.shutdown(wait=True)
 
 if __name__ == "__main__":
     fetcher = UnifiedFetcherV4()
@@ -13,13 +13,14 @@ Features:
 
 import os
 import sys
-import json
 import logging
 import pathlib
 import time
+import asyncio
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -32,8 +33,6 @@ logger = logging.getLogger(__name__)
 # Paths
 ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
 DATA_DIR = ROOT_DIR / 'data'
-CACHE_DIR = DATA_DIR / 'cache'
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Add current directory to sys.path for local imports
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
@@ -41,10 +40,10 @@ sys.path.insert(0, str(pathlib.Path(__file__).parent))
 # Import free_apis
 try:
     import free_apis
-    import requests
-    import yfinance as yf
-    import pandas as pd
-    import numpy as np
+    from fetch_utils import (
+        build_session, cache_read, cache_write, json_loads, json_dumps_compact, write_json, link_or_copy, strip_code_fence,
+        chat_body_template, chat_body_for, race_first
+    )
 except ImportError as e:
     logger.error(f"Missing dependencies: {e}")
     sys.exit(1)
@@ -55,6 +54,34 @@ except ImportError as e:
 
 IS_LOCAL = os.environ.get("IS_LOCAL", "false").lower() == "true"
 
+# Number of OpenRouter models raced concurrently per batch
+AI_RACE_WIDTH = 3
+
+# Reuse an AI analysis for identical inputs for this long (set AI_CACHE_DISABLE=1 to bypass)
+AI_CACHE_TTL = 6 * 3600
+AI_CACHE_DISABLE = os.environ.get("AI_CACHE_DISABLE", "0") == "1"
+
+# One shared worker pool for every blocking call (fetch stages, model requests, file writes)
+_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4), thread_name_prefix='fetcher')
+
+# (folder, AI result key, display name, directory) for every dashboard V5 writes
+DASHBOARDS = [
+    (db, db.replace('-', '_'), db.replace('-', ' ').title(), DATA_DIR / db)
+    for db in ('the-commander', 'the-shield', 'the-coin', 'the-map', 'the-frontier', 'the-strategy', 'the-library')
+]
+for *_, _path in DASHBOARDS:
+    _path.mkdir(parents=True, exist_ok=True)
+
+# Append-only per-source history written by fetch_all_data (one JSON row per change).
+# Kept out of git and Pages; CI carries it between runs with actions/cache
+HISTORY_DIR = DATA_DIR / 'history'
+
+# Fields that drift on every fetch without the source having new data; ignored when
+# deciding whether a history row changed
+HISTORY_VOLATILE_FIELDS = {
+    'news': {'score'},
+}
+
 # Master Prompt for "The Commander" (V6 Technical)
 COMMANDER_MASTER_PROMPT = """
 ROLE:
@@ -177,6 +204,8 @@ class UnifiedFetcherV5:
     def __init__(self):
         self.metrics = {}
         self.historical = {}
+        # Shared keep-alive session so the model fallback reuses TLS connections
+        self.session = build_session()
         self.ai_models = [
             "meta-llama/llama-3.3-70b-instruct:free",
             "mistralai/mistral-small-3.1-24b-instruct:free",
@@ -184,35 +213,108 @@ class UnifiedFetcherV5:
             "microsoft/phi-3-medium-128k-instruct:free",
         ]
 
-    def fetch_all_data(self):
+    async def fetch_all_data(self):
         logger.info("🚀 Starting Data Fetching Phase")
+
+        if IS_LOCAL:
+            # run_analysis returns the mock result in local mode, so the network data would go unused
+            logger.info("[Local Mode] Skipping data fetch.")
+            return
         
-        # 1. Market Data (yfinance)
-        self.fetch_market_data()
-        
-        # 2. FRED Data (via free_apis)
-        logger.info("🏛️ Fetching FRED Indicators")
-        self.metrics['fred'] = free_apis.get_fred_indicators()
-        
-        # 3. EIA Data (via free_apis)
-        logger.info("🛢️ Fetching EIA Energy Metrics")
-        self.metrics['eia'] = free_apis.get_energy_metrics()
-        
-        # 4. Crypto Metrics (via free_apis)
-        logger.info("🪙 Fetching Crypto Metrics")
-        self.metrics['crypto'] = free_apis.get_crypto_metrics()
-        
-        # 5. Fear & Greed
-        logger.info("😱 Fetching Fear & Greed")
-        self.metrics['fng'] = free_apis.fetch_fear_greed_history(days=1)[0] if free_apis.fetch_fear_greed_history(days=1) else {}
-        
-        # 6. News & Arxiv
-        logger.info("📰 Fetching News & Arxiv")
-        self.metrics['news'] = free_apis.fetch_hackernews_top()
+        # The stages are independent network calls, so run them side by side on worker threads.
+        # free_apis keeps its own per-source disk cache, so warm reruns read local files
+        logger.info("🏛️ Fetching Market Data, FRED, EIA, Crypto, Fear & Greed and News")
+        stages = {
+            'market': self._run_blocking(self.fetch_market_data),               # Market Data (yfinance, writes self.metrics)
+            'fred': self._run_blocking(free_apis.get_fred_indicators),
+            'eia': self._run_blocking(free_apis.get_energy_metrics),
+            'crypto': self._run_blocking(free_apis.get_crypto_metrics),
+            'fng': self._run_blocking(free_apis.fetch_fear_greed_history, 1),
+            'news': self._run_blocking(free_apis.fetch_hackernews_top),
+        }
+        # return_exceptions keeps one failing source from aborting the rest
+        results = dict(zip(stages, await asyncio.gather(*stages.values(), return_exceptions=True)))
+        for source, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning(f"  Failed {source}: {result}")
+                results[source] = {}
+        # fetch_market_data fills self.metrics directly; snapshot its tickers for the history
+        results['market'] = {name: data for name, data in self.metrics.items() if name not in results}
+
+        self.metrics['fred'] = results['fred']
+        self.metrics['eia'] = results['eia']
+        self.metrics['crypto'] = results['crypto']
+        self.metrics['fng'] = results['fng'][0] if results['fng'] else {}
+        self.metrics['news'] = results['news']
+
+        # Keep a per-source time series for later trend analysis
+        await self._run_blocking(self._append_history, {source: data for source, data in results.items() if data})
         
         # 7. Alpha Vantage (Specific Stocks if needed)
         # For now, we'll just ensure it's available
         
+    async def _run_blocking(self, fn, *args):
+        """Run a blocking callable on the shared fetcher thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_POOL, fn, *args)
+
+    def _append_history(self, snapshots: Dict[str, Any]):
+        """Append a timestamped row to DATA_DIR/history/{source}.jsonl for each source whose
+        data changed since its last row (blocking)"""
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        for source, data in snapshots.items():
+            path = HISTORY_DIR / f'{source}.jsonl'
+            try:
+                data_json = json_dumps_compact(data)
+                # free_apis serves cached sources unchanged, so an identical row means nothing was
+                # refetched; a changed row was fetched during this run and fetched_at is accurate
+                last_row = self._last_history_row(path)
+                if last_row is not None and (
+                    self._history_fingerprint(source, last_row.get('data'))
+                    == self._history_fingerprint(source, json_loads(data_json))
+                ):
+                    continue
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(f'{{"fetched_at":{json_dumps_compact(fetched_at)},"data":{data_json}}}\n')
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"  Could not record {source} history: {e}")
+
+    @staticmethod
+    def _history_fingerprint(source: str, data: Any) -> Any:
+        """data without the source's HISTORY_VOLATILE_FIELDS, for change detection"""
+        volatile = HISTORY_VOLATILE_FIELDS.get(source)
+        if not volatile:
+            return data
+
+        def strip(value):
+            if isinstance(value, dict):
+                return {k: strip(v) for k, v in value.items() if k not in volatile}
+            if isinstance(value, list):
+                return [strip(v) for v in value]
+            return value
+        return strip(data)
+
+    @staticmethod
+    def _last_history_row(path: pathlib.Path) -> Optional[Dict]:
+        """Parse the last line of a JSONL history file, reading backwards from the end"""
+        try:
+            with open(path, 'rb') as f:
+                pos = f.seek(0, os.SEEK_END)
+                tail = b''
+                while pos > 0:
+                    step = min(65536, pos)
+                    pos -= step
+                    f.seek(pos)
+                    tail = f.read(step) + tail
+                    # Ignore the trailing newline when looking for the start of the last row
+                    start = tail.rfind(b'\n', 0, len(tail) - 1)
+                    if start != -1:
+                        return json_loads(tail[start + 1:])
+                return json_loads(tail) if tail.strip() else None
+        except (FileNotFoundError, ValueError):
+            return None
+
     def fetch_market_data(self):
         tickers = {
             'SPY': 'SPY', 'QQQ': 'QQQ', 'IWM': 'IWM', 'VIX': '^VIX',
@@ -220,25 +322,27 @@ class UnifiedFetcherV5:
             'OIL': 'CL=F', 'TNX': '^TNX', 'DXY': 'DX-Y.NYB', 'TASI': '^TASI.SR'
         }
         
-        def fetch_ticker(name, symbol):
-            try:
-                t = yf.Ticker(symbol)
-                hist = t.history(period='5d')
-                if not hist.empty:
-                    return name, {
-                        'price': float(hist['Close'].iloc[-1]),
-                        'change': float((hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2]) if len(hist) > 1 else 0
-                    }
-                return name, None
-            except:
-                return name, None
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(fetch_ticker, name, symbol) for name, symbol in tickers.items()]
-            for future in as_completed(futures):
-                name, data = future.result()
-                if data:
-                    self.metrics[name] = data
+        # One batched request for every ticker (shared with other fetchers in this process).
+        # Only the last two closes are used, and Yahoo counts '2d' in trading sessions per ticker
+        try:
+            # Imported here so local/mock runs never pay for the yfinance/pandas import
+            from yf_cache import download_closes
+            closes = download_closes(tuple(tickers.values()), '2d')
+        except Exception as e:
+            logger.warning(f"Market data download failed: {e}")
+            return
+
+        for name, symbol in tickers.items():
+            # Closes are NaN-dropped per ticker: crypto trades on weekends, so the tickers don't share one calendar
+            close = closes.get(symbol)
+            if close is None:
+                continue
+            # Only the last two closes are needed; plain array indexing skips pandas' iloc/pct_change machinery
+            arr = close.to_numpy()
+            self.metrics[name] = {
+                'price': float(arr[-1]),
+                'change': float((arr[-1] - arr[-2]) / arr[-2]) if arr.size > 1 else 0
+            }
 
     async def run_analysis(self):
         logger.info("🤖 Starting AI Analysis Phase")
@@ -252,66 +356,135 @@ class UnifiedFetcherV5:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-        prompt = f"""
-        {COMMANDER_MASTER_PROMPT}
-        
-        DATA SUMMARY:
-        {json.dumps(data_summary, indent=2)}
-        """
+        # Only the data changes between runs; the fixed master prompt goes in the system message
+        # (a stable prefix providers can cache). Compact JSON, since whitespace costs tokens.
+        user_message = "DATA SUMMARY:\n" + json_dumps_compact(data_summary)
         
         api_key = os.environ.get('OPENROUTER_API_KEY')
         if not api_key:
             logger.error("OPENROUTER_API_KEY not found!")
             return {}
 
-        for model in self.ai_models:
+        # Key on the models and the data without its per-run timestamp, so unchanged inputs hit
+        cache_key = '|'.join(sorted(self.ai_models)) + '|' + COMMANDER_MASTER_PROMPT + json_dumps_compact(self.metrics)
+        if not AI_CACHE_DISABLE:
+            cached_result = await self._run_blocking(cache_read, cache_key, AI_CACHE_TTL, 'ai')
+            if cached_result:
+                logger.info("  Using cached AI analysis for identical inputs.")
+                return cached_result
+
+        # Every attempt sends the same body apart from the model name, so serialize it once
+        body_template = chat_body_template(
+            [
+                {"role": "system", "content": COMMANDER_MASTER_PROMPT},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+
+        result = await self._race_models(api_key, body_template)
+        if result and not AI_CACHE_DISABLE:
             try:
-                logger.info(f"  Attempting {model}...")
-                resp = requests.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                    json={
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": "You are the Commander. Output strictly valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3,
-                        "response_format": {"type": "json_object"}
-                    },
-                    timeout=90
-                )
-                if resp.status_code == 200:
-                    content = resp.json()['choices'][0]['message']['content']
-                    return json.loads(content)
-            except Exception as e:
-                logger.warning(f"  Failed {model}: {e}")
-                
-        return {}
+                await self._run_blocking(cache_write, cache_key, result, 'ai')
+            except OSError as e:
+                logger.warning(f"  Could not cache AI analysis: {e}")
+        return result
+
+    async def _race_models(self, api_key: str, body_template: bytes) -> Dict:
+        """Race AI_RACE_WIDTH models at a time; the first valid response wins and each failure
+        immediately frees its slot for the next model in line"""
+        # Set once the race is decided so losing streams close their connections
+        stop = threading.Event()
+        result = await race_first(
+            self.ai_models,
+            lambda model: self._run_blocking(self._post_model, api_key, model, body_template, stop),
+            AI_RACE_WIDTH,
+            stop=stop
+        )
+        return result or {}
+
+    def _post_model(self, api_key: str, model: str, body_template: bytes,
+                    stop: Optional[threading.Event] = None) -> Optional[Dict]:
+        """Call one OpenRouter model (blocking); returns the parsed analysis or None.
+
+        The completion is streamed over SSE so errors, truncated output and a set stop
+        event abort the connection as soon as they show up instead of after the full response.
+        """
+        try:
+            if stop and stop.is_set():
+                return None
+            logger.info(f"  Attempting {model}...")
+            with self.session.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+                data=chat_body_for(body_template, model),
+                stream=True,
+                timeout=90
+            ) as resp:
+                if resp.status_code != 200:
+                    logger.warning(f"  Failed {model}: HTTP {resp.status_code}")
+                    return None
+
+                parts = []
+                for line in resp.iter_lines():
+                    if stop and stop.is_set():
+                        # Another model already won; leaving the block closes the connection
+                        return None
+                    # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank separators
+                    if not line.startswith(b'data:'):
+                        continue
+                    event = line[5:].strip()
+                    if event == b'[DONE]':
+                        break
+                    chunk = json_loads(event)
+                    if 'error' in chunk:
+                        logger.warning(f"  Failed {model}: {chunk['error'].get('message', chunk['error'])}")
+                        return None
+                    choice = chunk['choices'][0]
+                    parts.append(choice.get('delta', {}).get('content') or '')
+                    if choice.get('finish_reason') == 'length':
+                        logger.warning(f"  Failed {model}: output truncated at the token limit")
+                        return None
+                    if choice.get('finish_reason'):
+                        break
+
+            result = json_loads(strip_code_fence(''.join(parts)))
+            if not isinstance(result, dict):
+                logger.warning(f"  Failed {model}: expected a JSON object, got {type(result).__name__}")
+                return None
+            return result
+        except Exception as e:
+            logger.warning(f"  Failed {model}: {e}")
+        return None
 
     def save_dashboards(self, ai_result: Dict):
         logger.info("💾 Saving Dashboards")
         
-        dashboards = ['the-commander', 'the-shield', 'the-coin', 'the-map', 'the-frontier', 'the-strategy', 'the-library']
+        result = self._parse_ai_result(ai_result, [db_key for _, db_key, _, _ in DASHBOARDS])
+        # One timestamp for the whole save keeps every dashboard consistent
+        now_iso = datetime.now(timezone.utc).isoformat()
         
-        for db in dashboards:
-            db_key = db.replace('-', '_')
+        jobs = []
+        for db, db_key, display_name, path in DASHBOARDS:
             data = {
-                "name": db.replace('-', ' ').title(),
-                "last_update": datetime.now(timezone.utc).isoformat(),
+                "name": display_name,
+                "last_update": now_iso,
                 "meta": {
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "generated_at": now_iso,
                     "version": "5.0"
                 },
-                "ai_analysis": ai_result.get(db_key, {}).get('analysis', 'Analysis unavailable')
+                "ai_analysis": result[db_key]['analysis']
             }
             
             # Special handling for Commander
             if db == 'the-commander':
-                data['sentiment'] = ai_result.get('the_commander', {}).get('sentiment', {})
-                data['portfolio_guidance'] = ai_result.get('the_commander', {}).get('portfolio_guidance', {})
-                data['old_stand_verdict'] = ai_result.get('the_commander', {}).get('old_stand_verdict', {})
-                data['alpha_loop'] = ai_result.get('the_commander', {}).get('alpha_loop', [])
+                commander = result['the_commander']
+                data['sentiment'] = commander['sentiment']
+                data['portfolio_guidance'] = commander['portfolio_guidance']
+                data['old_stand_verdict'] = commander['old_stand_verdict']
+                data['alpha_loop'] = commander['alpha_loop']
                 
                 # Add metrics for display
                 data['metrics'] = [
@@ -320,15 +493,40 @@ class UnifiedFetcherV5:
                     {"name": "Fed Rate", "value": f"{self.metrics.get('fred', {}).get('fed_funds', 0):.2f}%", "signal": "NORMAL"}
                 ]
 
-            path = DATA_DIR / db
-            path.mkdir(parents=True, exist_ok=True)
+            jobs.append((db, path, data))
+
+        # Overlap the file writes instead of flushing 14 files one after another
+        list(_POOL.map(lambda job: self._write_dashboard(*job), jobs))
+
+    @staticmethod
+    def _parse_ai_result(ai_result: Dict, dashboard_keys: List[str]) -> Dict:
+        """Normalize the AI result once so every field save_dashboards reads is present.
+
+        Missing or wrongly typed sections fall back to the same defaults the dashboards
+        have always shown, so callers can index directly.
+        """
+        def section(value, default):
+            return value if isinstance(value, type(default)) else default
+
+        result = {}
+        for key in dashboard_keys:
+            board = section(ai_result.get(key), {})
+            result[key] = {**board, 'analysis': board.get('analysis', 'Analysis unavailable')}
+
+        commander = result['the_commander']
+        commander['sentiment'] = section(commander.get('sentiment'), {})
+        commander['portfolio_guidance'] = section(commander.get('portfolio_guidance'), {})
+        commander['old_stand_verdict'] = section(commander.get('old_stand_verdict'), {})
+        commander['alpha_loop'] = section(commander.get('alpha_loop'), [])
+        return result
+
+    def _write_dashboard(self, db: str, path: pathlib.Path, data: Dict):
+        """Write one dashboard's latest.json and data.json (blocking)"""
+        write_json(path / 'latest.json', data)
+        # Same content: link instead of serializing and writing it twice
+        link_or_copy(path / 'latest.json', path / 'data.json')
             
-            with open(path / 'latest.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            with open(path / 'data.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-                
-            logger.info(f"  ✅ Saved {db}")
+        logger.info(f"  ✅ Saved {db}")
 
     def get_mock_result(self):
         return {
@@ -360,12 +558,11 @@ class UnifiedFetcherV5:
 
 async def main():
     fetcher = UnifiedFetcherV5()
-    fetcher.fetch_all_data()
+    await fetcher.fetch_all_data()
     ai_result = await fetcher.run_analysis()
     if ai_result:
         fetcher.save_dashboards(ai_result)
     logger.info("🎉 Daily Alpha Loop V5 Complete")
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
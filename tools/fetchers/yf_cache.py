@@ -0,0 +1,49 @@
+"""
+Shared yfinance Cache
+=====================
+One batched yf.download per (symbols, period), memoized for the life of the
+process so fetchers asking for the same tickers reuse the result. Empty results
+are not memoized, so a failed download is retried by the next caller.
+"""
+
+from typing import Dict, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+
+_closes_cache: Dict[Tuple[Tuple[str, ...], str], Dict[str, pd.Series]] = {}
+
+
+def download_closes(symbols: Tuple[str, ...], period: str) -> Dict[str, pd.Series]:
+    """Close prices per symbol from one batched download (shared between callers; treat as read-only)"""
+    key = (symbols, period)
+    closes = _closes_cache.get(key)
+    if closes is None:
+        closes = _download_closes(symbols, period)
+        if closes:
+            _closes_cache[key] = closes
+    return closes
+
+
+def _download_closes(symbols: Tuple[str, ...], period: str) -> Dict[str, pd.Series]:
+    # Only Close is used: regular-session bars, no dividend/split rows and no price adjustment pass
+    df = yf.download(
+        list(symbols), period=period, group_by='ticker', threads=True, progress=False,
+        prepost=False, actions=False, auto_adjust=False
+    )
+    closes = {}
+    if df is None or df.empty:
+        return closes
+
+    multi = isinstance(df.columns, pd.MultiIndex)
+    for symbol in symbols:
+        try:
+            close = df[symbol]['Close'] if multi else df['Close']
+        except KeyError:
+            continue
+        # The batch shares one date index, so drop days this ticker didn't trade
+        close = close.dropna()
+        if not close.empty:
+            closes[symbol] = close
+    return closes